@@ -0,0 +1,18 @@
+from flask.json.provider import JSONProvider
+import orjson
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() encodes in C
+
+    Kept free of heavy imports so the Vercel app can use it too. orjson
+    always writes compact output, so ``separators`` and ``indent`` are
+    ignored; ``sort_keys`` is honoured and any other json.dumps keyword
+    arguments Flask passes are ignored.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if kwargs.get('sort_keys') else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
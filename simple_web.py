@@ -1,68 +1,253 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session
-import datetime
-import json
+from flask import Flask, Response, render_template, request, jsonify, redirect, url_for, session
+import asyncio
+import collections
+import hashlib
+import orjson
+import queue
 import threading
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 import uuid
 
+from json_provider import OrjsonProvider
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'tradingagents_secret_key'
+app.json = OrjsonProvider(app)
 
 # Global storage for analysis sessions
 analysis_sessions = {}
 
+# All analyses run as coroutines on one background event loop, so concurrent
+# sessions overlap their LLM I/O instead of each holding an OS thread
+analysis_loop = asyncio.new_event_loop()
+threading.Thread(target=analysis_loop.run_forever, daemon=True).start()
+
+# Report sections in pipeline order: (state key, agent that produced it,
+# progress step, fixed progress or None to use the streamed estimate).
+# investment_plan carries the research manager's judge_decision.
+REPORT_UPDATES = (
+    ("market_report", "Market Analyst", "Market analysis completed", None),
+    ("sentiment_report", "Social Analyst", "Social sentiment analysis completed", None),
+    ("news_report", "News Analyst", "News analysis completed", None),
+    ("fundamentals_report", "Fundamentals Analyst", "Fundamentals analysis completed", None),
+    ("investment_plan", "Research Manager", "Research team decision completed", None),
+    ("trader_investment_plan", "Trader", "Trading plan completed", None),
+    ("final_trade_decision", "Portfolio Manager", "Analysis completed!", 100),
+)
+
+# Compiled graphs are shared by every session with the same configuration.
+# Each graph holds LLM clients and memories, so only the most recently used
+# few are kept; the key stores a hash of the API key, never the key itself.
+GRAPH_CACHE_SIZE = 4
+graph_cache: "collections.OrderedDict[tuple, TradingAgentsGraph]" = collections.OrderedDict()
+graph_cache_lock = threading.Lock()
+# Per-key locks so a graph is built once, without blocking other configs
+graph_build_locks: Dict[tuple, threading.Lock] = {}
+
+# add_message runs once per streamed chunk, so the "%H:%M:%S" string is
+# formatted at most once per second of wall time and reused in between
+_last_ts_sec = 0
+_last_ts_str = ''
+_ts_lock = threading.Lock()
+
+def message_timestamp():
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        with _ts_lock:
+            if sec != _last_ts_sec:
+                _last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+                _last_ts_sec = sec
+    return _last_ts_str
+
 class SimpleMessageBuffer:
+    __slots__ = ('session_id', 'messages', 'agent_status', 'report_sections',
+                 'current_step', 'progress', 'status', 'seq', 'subscribers')
+
+    AGENT_STATUS_TEMPLATE = {
+        "Market Analyst": "pending",
+        "Social Analyst": "pending", 
+        "News Analyst": "pending",
+        "Fundamentals Analyst": "pending",
+        "Bull Researcher": "pending",
+        "Bear Researcher": "pending",
+        "Research Manager": "pending",
+        "Trader": "pending",
+        "Risky Analyst": "pending",
+        "Neutral Analyst": "pending",
+        "Safe Analyst": "pending",
+        "Portfolio Manager": "pending",
+    }
+
+    REPORT_SECTIONS_TEMPLATE = {
+        "market_report": None,
+        "sentiment_report": None,
+        "news_report": None,
+        "fundamentals_report": None,
+        "investment_plan": None,
+        "trader_investment_plan": None,
+        "final_trade_decision": None,
+    }
+
+    # Older messages are dropped; clients only ever see the tail of the log
+    MAX_MESSAGES = 500
+
     def __init__(self, session_id):
         self.session_id = session_id
-        self.messages = []
-        self.agent_status = {
-            "Market Analyst": "pending",
-            "Social Analyst": "pending", 
-            "News Analyst": "pending",
-            "Fundamentals Analyst": "pending",
-            "Bull Researcher": "pending",
-            "Bear Researcher": "pending",
-            "Research Manager": "pending",
-            "Trader": "pending",
-            "Risky Analyst": "pending",
-            "Neutral Analyst": "pending",
-            "Safe Analyst": "pending",
-            "Portfolio Manager": "pending",
-        }
-        self.report_sections = {
-            "market_report": None,
-            "sentiment_report": None,
-            "news_report": None,
-            "fundamentals_report": None,
-            "investment_plan": None,
-            "trader_investment_plan": None,
-            "final_trade_decision": None,
-        }
+        self.messages = collections.deque(maxlen=self.MAX_MESSAGES)
+        self.agent_status = self.AGENT_STATUS_TEMPLATE.copy()
+        self.report_sections = self.REPORT_SECTIONS_TEMPLATE.copy()
         self.current_step = "waiting"
         self.progress = 0
         self.status = "pending"
+        self.seq = 0
+        self.subscribers = []
+
+    def subscribe(self):
+        """Register a queue that receives every subsequent buffer update"""
+        q = queue.Queue()
+        self.subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q):
+        if q in self.subscribers:
+            self.subscribers.remove(q)
+
+    def _publish(self, event, data):
+        for q in list(self.subscribers):
+            q.put((event, data))
+
+    def messages_copy(self):
+        # The analysis loop appends from another thread; list() copies the deque
+        # in one C-level call, whereas iterating it in Python can raise
+        # "deque mutated during iteration"
+        return list(self.messages)
+
+    def recent_messages(self, count):
+        return self.messages_copy()[-count:]
+
+    def snapshot(self):
+        return {
+            'messages': self.recent_messages(10),
+            'agent_status': self.agent_status,
+            'report_sections': self.report_sections,
+            'progress': self.progress,
+            'current_step': self.current_step,
+            'status': self.status,
+            'seq': self.seq,
+        }
 
     def add_message(self, message_type, content):
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        message = {"timestamp": timestamp, "type": message_type, "content": content}
+        timestamp = message_timestamp()
+        self.seq += 1
+        message = {"seq": self.seq, "timestamp": timestamp, "type": message_type, "content": content}
         self.messages.append(message)
+        self._publish("message", message)
+
+    # Streamed chunks carry every report finished so far, so these only
+    # publish when the value actually changes
 
     def update_agent_status(self, agent, status):
+        if self.agent_status.get(agent) == status:
+            return
         self.agent_status[agent] = status
+        self._publish("agent_status", {"agent": agent, "status": status})
 
     def update_report_section(self, section_name, content):
-        if section_name in self.report_sections:
-            self.report_sections[section_name] = content
+        if section_name not in self.report_sections:
+            return
+        if self.report_sections[section_name] == content:
+            return
+        self.report_sections[section_name] = content
+        self._publish("report", {"section": section_name, "content": content})
 
     def update_progress(self, progress, step):
         self.progress = progress
         self.current_step = step
+        self._publish("progress", {"progress": progress, "step": step})
+
+    def update_status(self, status):
+        self.status = status
+        self._publish("status", {"status": status})
+
+def _cached_graph(key):
+    with graph_cache_lock:
+        graph = graph_cache.get(key)
+        if graph is not None:
+            graph_cache.move_to_end(key)
+        return graph
+
+def cleanup_graph_memories(graph):
+    """Drop the Chroma collections of a graph that was evicted from the cache"""
+    for memory in (graph.bull_memory, graph.bear_memory, graph.trader_memory,
+                   graph.invest_judge_memory, graph.risk_manager_memory):
+        try:
+            memory.chroma_client.delete_collection(name=memory.situation_collection.name)
+        except Exception as e:
+            print(f"[WARNING] Failed to cleanup collection {memory.situation_collection.name}: {e}")
+
+def get_graph(config: Dict) -> TradingAgentsGraph:
+    """Return the graph for this LLM/analyst setup, building it on first use"""
+    api_key = config.get('api_key', '')
+    key = (
+        config['llm_provider'],
+        config['backend_url'],
+        hashlib.sha256(api_key.encode()).hexdigest(),
+        config['shallow_thinker'],
+        config['deep_thinker'],
+        config['research_depth'],
+        tuple(config['analysts']),
+    )
+    graph = _cached_graph(key)
+    if graph is not None:
+        return graph
+
+    with graph_cache_lock:
+        build_lock = graph_build_locks.setdefault(key, threading.Lock())
+    with build_lock:
+        # Another request may have built it while we waited
+        graph = _cached_graph(key)
+        if graph is not None:
+            return graph
+        try:
+            # Update configuration based on user selections
+            updated_config = DEFAULT_CONFIG.copy()
+            updated_config.update({
+                'llm_provider': config['llm_provider'],
+                'backend_url': config['backend_url'],
+                'api_key': api_key,
+                'quick_think_llm': config['shallow_thinker'],
+                'deep_think_llm': config['deep_thinker'],
+                'research_depth': config['research_depth'],
+                # Memory collections live in one process-wide Chroma client and
+                # are recreated by name, so each cached graph needs its own suffix
+                'session_id': 'graph_' + hashlib.sha256(repr(key).encode()).hexdigest()[:12]
+            })
+            graph = TradingAgentsGraph(
+                selected_analysts=config['analysts'],
+                config=updated_config
+            )
+            evicted = []
+            with graph_cache_lock:
+                graph_cache[key] = graph
+                while len(graph_cache) > GRAPH_CACHE_SIZE:
+                    evicted.append(graph_cache.popitem(last=False)[1])
+            for old_graph in evicted:
+                cleanup_graph_memories(old_graph)
+        finally:
+            with graph_cache_lock:
+                graph_build_locks.pop(key, None)
+    return graph
+
+def set_session_status(session_id, status):
+    session = analysis_sessions[session_id]
+    session['status'] = status
+    session['buffer'].update_status(status)
 
 @app.route('/')
 def index():
@@ -85,49 +270,65 @@ def start_analysis():
         'buffer': SimpleMessageBuffer(session_id),
         'status': 'running'
     }
+    set_session_status(session_id, 'running')
     
     # Start analysis in background
-    thread = threading.Thread(
-        target=run_analysis_background, 
-        args=(session_id, data)
+    asyncio.run_coroutine_threadsafe(
+        run_analysis_background(session_id, data), analysis_loop
     )
-    thread.daemon = True
-    thread.start()
     
     return jsonify({'session_id': session_id, 'status': 'started'})
 
 @app.route('/api/status/<session_id>')
 def get_status(session_id):
+    """Polling fallback for /api/stream; pass ?since_seq=N to get only newer messages"""
+    if session_id not in analysis_sessions:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    buffer = analysis_sessions[session_id]['buffer']
+    status = buffer.snapshot()
+    since_seq = request.args.get('since_seq', type=int)
+    if since_seq is not None:
+        status['messages'] = [m for m in buffer.messages_copy() if m['seq'] > since_seq]
+    return jsonify(status)
+
+@app.route('/api/stream/<session_id>')
+def stream_status(session_id):
+    """Push buffer updates to the client as Server-Sent Events"""
     if session_id not in analysis_sessions:
         return jsonify({'error': 'Session not found'}), 404
     
     buffer = analysis_sessions[session_id]['buffer']
-    return jsonify({
-        'messages': buffer.messages[-10:],  # Last 10 messages
-        'agent_status': buffer.agent_status,
-        'report_sections': buffer.report_sections,
-        'progress': buffer.progress,
-        'current_step': buffer.current_step,
-        'status': analysis_sessions[session_id]['status']
-    })
-
-def run_analysis_background(session_id: str, config: Dict):
-    """Run the trading analysis in background thread"""
+    return Response(event_stream(buffer), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+def event_stream(buffer):
+    # Subscribe before taking the snapshot so no update falls in between
+    q = buffer.subscribe()
+    try:
+        snapshot = buffer.snapshot()
+        yield f"event: snapshot\ndata: {orjson.dumps(snapshot).decode()}\n\n"
+        if snapshot['status'] != 'running':
+            return
+        while True:
+            try:
+                event, data = q.get(timeout=15)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+            if event == 'status' and data['status'] != 'running':
+                return
+    finally:
+        buffer.unsubscribe(q)
+
+async def run_analysis_background(session_id: str, config: Dict):
+    """Run the trading analysis on the background event loop"""
     try:
         buffer = analysis_sessions[session_id]['buffer']
         
-        # Initialize the graph
-        graph = TradingAgentsGraph(DEFAULT_CONFIG)
-        
-        # Update configuration based on user selections
-        updated_config = DEFAULT_CONFIG.copy()
-        updated_config.update({
-            'llm_provider': config['llm_provider'],
-            'backend_url': config['backend_url'],
-            'shallow_thinker': config['shallow_thinker'],
-            'deep_thinker': config['deep_thinker'],
-            'research_depth': config['research_depth']
-        })
+        # Initialize the graph (blocking setup, so keep it off the event loop)
+        graph = await asyncio.to_thread(get_graph, config)
         
         # Create initial state
         init_state = graph.propagator.create_initial_state(
@@ -145,7 +346,7 @@ def run_analysis_background(session_id: str, config: Dict):
         step_count = 0
         total_steps = len(config['analysts']) * 2 + 5
         
-        for chunk in graph.graph.stream(init_state, **args):
+        async for chunk in graph.graph.astream(init_state, **args):
             step_count += 1
             progress = min(90, (step_count / total_steps) * 80 + 10)
             
@@ -153,60 +354,40 @@ def run_analysis_background(session_id: str, config: Dict):
                 last_message = chunk["messages"][-1]
                 
                 if hasattr(last_message, "content"):
-                    content = str(last_message.content)
-                    if len(content) > 500:
+                    # Plain-text content is measured in place; only content
+                    # blocks (lists) need converting to a string first
+                    raw = last_message.content
+                    content = raw if isinstance(raw, str) else str(raw)
+                    if len(content) > 500:  # Truncate very long messages
                         content = content[:500] + "..."
                     buffer.add_message("Analysis", content)
                 
-                # Update agent statuses and reports (same logic as before)
-                if "market_report" in chunk and chunk["market_report"]:
-                    buffer.update_report_section("market_report", chunk["market_report"])
-                    buffer.update_agent_status("Market Analyst", "completed")
-                    buffer.update_progress(progress, "Market analysis completed")
-                
-                if "sentiment_report" in chunk and chunk["sentiment_report"]:
-                    buffer.update_report_section("sentiment_report", chunk["sentiment_report"])
-                    buffer.update_agent_status("Social Analyst", "completed")
-                    buffer.update_progress(progress, "Social sentiment analysis completed")
-                
-                if "news_report" in chunk and chunk["news_report"]:
-                    buffer.update_report_section("news_report", chunk["news_report"])
-                    buffer.update_agent_status("News Analyst", "completed")
-                    buffer.update_progress(progress, "News analysis completed")
-                
-                if "fundamentals_report" in chunk and chunk["fundamentals_report"]:
-                    buffer.update_report_section("fundamentals_report", chunk["fundamentals_report"])
-                    buffer.update_agent_status("Fundamentals Analyst", "completed")
-                    buffer.update_progress(progress, "Fundamentals analysis completed")
-                
-                if "investment_debate_state" in chunk and chunk["investment_debate_state"]:
-                    debate_state = chunk["investment_debate_state"]
-                    
-                    if "judge_decision" in debate_state and debate_state["judge_decision"]:
-                        buffer.update_report_section("investment_plan", debate_state["judge_decision"])
-                        buffer.update_agent_status("Research Manager", "completed")
-                        buffer.update_progress(progress, "Research team decision completed")
-                
-                if "trader_investment_plan" in chunk and chunk["trader_investment_plan"]:
-                    buffer.update_report_section("trader_investment_plan", chunk["trader_investment_plan"])
-                    buffer.update_agent_status("Trader", "completed")
-                    buffer.update_progress(progress, "Trading plan completed")
-                
-                if "final_trade_decision" in chunk and chunk["final_trade_decision"]:
-                    buffer.update_report_section("final_trade_decision", chunk["final_trade_decision"])
-                    buffer.update_agent_status("Portfolio Manager", "completed")
-                    buffer.update_progress(100, "Analysis completed!")
+                # Update agent statuses and reports; progress is flushed once
+                # per chunk with the latest completed step
+                latest_progress, latest_step = progress, None
+                for key, agent, step, fixed_progress in REPORT_UPDATES:
+                    value = chunk.get(key)
+                    if value:
+                        buffer.update_report_section(key, value)
+                        buffer.update_agent_status(agent, "completed")
+                        latest_progress, latest_step = fixed_progress or progress, step
+                if latest_step:
+                    buffer.update_progress(latest_progress, latest_step)
         
         buffer.update_progress(100, "Analysis completed successfully!")
-        analysis_sessions[session_id]['status'] = 'completed'
+        set_session_status(session_id, 'completed')
         
     except Exception as e:
         buffer.add_message("Error", f"Analysis failed: {str(e)}")
         buffer.update_progress(0, "Analysis failed")
-        analysis_sessions[session_id]['status'] = 'failed'
+        set_session_status(session_id, 'failed')
 
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
     Path('templates').mkdir(exist_ok=True)
     
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    # Development only. In production serve with a threaded WSGI server, e.g.
+    #   gunicorn -w 1 -k gthread --threads 32 -b 0.0.0.0:5000 simple_web:app
+    # Keep a single worker: sessions and the analysis loop live in process
+    # memory, and every open /api/stream connection holds one thread.
+    app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
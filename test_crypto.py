@@ -15,6 +15,7 @@ from tradingagents.dataflows.coingecko_utils import (
     get_crypto_news,
     get_crypto_technical_indicators
 )
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 def test_crypto_functions():
@@ -25,46 +26,39 @@ def test_crypto_functions():
     # Test crypto symbol
     crypto_symbol = "BTC"
     curr_date = "2024-12-01"
+    start_date = "2024-11-01"
     
-    print(f"\n📊 Testing Market Data for {crypto_symbol}...")
-    try:
-        market_data = get_crypto_market_data(crypto_symbol)
-        print("✅ Market data retrieved successfully!")
-        print(market_data[:500] + "..." if len(market_data) > 500 else market_data)
-    except Exception as e:
-        print(f"❌ Error getting market data: {e}")
+    # (heading, success message, error label, function, args)
+    checks = [
+        (f"📊 Testing Market Data for {crypto_symbol}...", "Market data retrieved successfully!",
+         "market data", get_crypto_market_data, (crypto_symbol,)),
+        (f"📈 Testing Price History for {crypto_symbol}...", "Price data retrieved successfully!",
+         "price data", get_crypto_price_data, (crypto_symbol, start_date, curr_date)),
+        (f"📰 Testing News for {crypto_symbol}...", "News data retrieved successfully!",
+         "news data", get_crypto_news, (crypto_symbol, curr_date, 7)),
+        (f"📊 Testing Technical Analysis for {crypto_symbol}...", "Technical analysis retrieved successfully!",
+         "technical data", get_crypto_technical_indicators, (crypto_symbol, curr_date, 30)),
+    ]
     
-    print(f"\n📈 Testing Price History for {crypto_symbol}...")
-    try:
-        start_date = "2024-11-01"
-        price_data = get_crypto_price_data(crypto_symbol, start_date, curr_date)
-        print("✅ Price data retrieved successfully!")
-        print(price_data[:500] + "..." if len(price_data) > 500 else price_data)
-    except Exception as e:
-        print(f"❌ Error getting price data: {e}")
-    
-    print(f"\n📰 Testing News for {crypto_symbol}...")
-    try:
-        news_data = get_crypto_news(crypto_symbol, curr_date, 7)
-        print("✅ News data retrieved successfully!")
-        print(news_data[:500] + "..." if len(news_data) > 500 else news_data)
-    except Exception as e:
-        print(f"❌ Error getting news data: {e}")
-    
-    print(f"\n📊 Testing Technical Analysis for {crypto_symbol}...")
-    try:
-        tech_data = get_crypto_technical_indicators(crypto_symbol, curr_date, 30)
-        print("✅ Technical analysis retrieved successfully!")
-        print(tech_data[:500] + "..." if len(tech_data) > 500 else tech_data)
-    except Exception as e:
-        print(f"❌ Error getting technical data: {e}")
+    # The API calls are independent and network-bound, so issue them all at once
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(func, *args) for _, _, _, func, args in checks]
+        
+        for (heading, success, label, _, _), future in zip(checks, futures):
+            print(f"\n{heading}")
+            try:
+                data = future.result()
+                print(f"✅ {success}")
+                print(data[:500] + "..." if len(data) > 500 else data)
+            except Exception as e:
+                print(f"❌ Error getting {label}: {e}")
 
 def test_symbol_detection():
     """Test the crypto symbol detection function"""
     print("\n🔍 Testing Symbol Detection...")
     print("=" * 50)
     
-    from tradingagents.agents.analysts.fundamentals_analyst import _is_crypto_symbol
+    from tradingagents.agents.utils.symbol_utils import is_crypto_symbol
     
     # Test crypto symbols
     crypto_symbols = ["BTC", "ETH", "ADA", "SOL", "DOGE"]
@@ -73,17 +67,17 @@ def test_symbol_detection():
     
     print("Known Crypto symbols:")
     for symbol in crypto_symbols:
-        result = _is_crypto_symbol(symbol)
+        result = is_crypto_symbol(symbol)
         print(f"  {symbol}: {result} {'✅' if result else '❌'}")
     
     print("\nKnown Stock symbols:")
     for symbol in stock_symbols:
-        result = _is_crypto_symbol(symbol)
+        result = is_crypto_symbol(symbol)
         print(f"  {symbol}: {result} {'❌' if result else '✅'}")
     
     print("\nUnknown symbols (should default to stocks):")
     for symbol in unknown_symbols:
-        result = _is_crypto_symbol(symbol)
+        result = is_crypto_symbol(symbol)
         print(f"  {symbol}: {result} {'❌' if result else '✅'}")
 
 if __name__ == "__main__":
@@ -1,70 +1,12 @@
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
+from typing import Final
+from tradingagents.agents.utils.agent_utils import create_analyst_chain
+from tradingagents.agents.utils.symbol_utils import is_crypto_symbol
 
 
-def _is_crypto_symbol(symbol: str) -> bool:
-    """
-    Detect if a symbol is likely a cryptocurrency
-    Uses a whitelist approach for known crypto symbols and excludes known stock patterns
-    """
-    # Known crypto symbols (most common ones)
-    crypto_symbols = {
-        'BTC', 'ETH', 'ADA', 'SOL', 'DOT', 'AVAX', 'MATIC', 'LINK', 'UNI', 'AAVE',
-        'XRP', 'LTC', 'BCH', 'EOS', 'TRX', 'XLM', 'VET', 'ALGO', 'ATOM', 'LUNA',
-        'NEAR', 'FTM', 'CRO', 'SAND', 'MANA', 'AXS', 'GALA', 'ENJ', 'CHZ', 'BAT',
-        'ZEC', 'DASH', 'XMR', 'DOGE', 'SHIB', 'PEPE', 'FLOKI', 'BNB', 'USDT', 'USDC',
-        'TON', 'ICP', 'HBAR', 'THETA', 'FIL', 'ETC', 'MKR', 'APT', 'LDO', 'OP',
-        'IMX', 'GRT', 'RUNE', 'FLOW', 'EGLD', 'XTZ', 'MINA', 'ROSE', 'KAVA'
-    }
-    
-    # Known stock symbols (to avoid false positives)
-    stock_symbols = {
-        'AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX', 'DIS', 'AMD',
-        'INTC', 'CRM', 'ORCL', 'ADBE', 'CSCO', 'PEP', 'KO', 'WMT', 'JNJ', 'PFE',
-        'V', 'MA', 'HD', 'UNH', 'BAC', 'XOM', 'CVX', 'LLY', 'ABBV', 'COST',
-        'AVGO', 'TMO', 'ACN', 'DHR', 'TXN', 'LOW', 'QCOM', 'HON', 'UPS', 'MDT'
-    }
-    
-    symbol_upper = symbol.upper()
-    
-    # If it's a known stock symbol, it's definitely not crypto
-    if symbol_upper in stock_symbols:
-        return False
-    
-    # If it's a known crypto symbol, it's definitely crypto
-    if symbol_upper in crypto_symbols:
-        return True
-    
-    # For unknown symbols, be conservative and assume it's a stock
-    # unless it has typical crypto characteristics
-    if len(symbol) >= 5:  # Most stocks are 4+ characters
-        return False
-    
-    # Short symbols (2-4 chars) could be crypto if they don't look like stocks
-    if len(symbol) <= 4 and symbol.isalnum() and not any(c in symbol for c in ['.', '-', '_']):
-        # Additional heuristic: crypto symbols often have certain patterns
-        return True
-    
-    return False
-
-
-def create_market_analyst(llm, toolkit):
-
-    def market_analyst_node(state):
-        current_date = state["trade_date"]
-        ticker = state["company_of_interest"]
-        company_name = state["company_of_interest"]
-
-        # Check if we're dealing with crypto or stocks
-        is_crypto = _is_crypto_symbol(ticker)
-        
-        if is_crypto:
-            # Use crypto-specific tools
-            tools = [toolkit.get_crypto_price_history, toolkit.get_crypto_technical_analysis]
-            
-            system_message = (
-                """You are a cryptocurrency technical analyst tasked with analyzing crypto markets. Your role is to provide comprehensive technical analysis for cryptocurrency trading. Focus on crypto-specific patterns and indicators that are most relevant for digital assets.
+CRYPTO_SYSTEM_MESSAGE: Final[str] = (
+    """You are a cryptocurrency technical analyst tasked with analyzing crypto markets. Your role is to provide comprehensive technical analysis for cryptocurrency trading. Focus on crypto-specific patterns and indicators that are most relevant for digital assets.
 
 Key areas to analyze for cryptocurrency:
 - Price action and trend analysis
@@ -75,23 +17,11 @@ Key areas to analyze for cryptocurrency:
 - Market sentiment and psychological levels
 
 Please write a very detailed and nuanced report of the trends you observe in the cryptocurrency market. Analyze both short-term and long-term trends. Do not simply state the trends are mixed, provide detailed and fine-grained analysis and insights that may help crypto traders make decisions. Consider the unique characteristics of cryptocurrency markets such as 24/7 trading, higher volatility, and sentiment-driven movements."""
-                + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-            )
-        else:
-            # Use stock-specific tools (original functionality)
-            if toolkit.config["online_tools"]:
-                tools = [
-                    toolkit.get_YFin_data_online,
-                    toolkit.get_stockstats_indicators_report_online,
-                ]
-            else:
-                tools = [
-                    toolkit.get_YFin_data,
-                    toolkit.get_stockstats_indicators_report,
-                ]
-
-            system_message = (
-                """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
+    + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+)
+
+STOCK_SYSTEM_MESSAGE: Final[str] = (
+    """You are a trading assistant tasked with analyzing financial markets. Your role is to select the **most relevant indicators** for a given market condition or trading strategy from the following list. The goal is to choose up to **8 indicators** that provide complementary insights without redundancy. Categories and each category's indicators are:
 
 Moving Averages:
 - close_50_sma: 50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.
@@ -116,40 +46,49 @@ Volume-Based Indicators:
 - vwma: VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses.
 
 - Select indicators that provide diverse and complementary information. Avoid redundancy (e.g., do not select both rsi and stochrsi). Also briefly explain why they are suitable for the given market context. When you tool call, please use the exact name of the indicators provided above as they are defined parameters, otherwise your call will fail. Please make sure to call get_YFin_data first to retrieve the CSV that is needed to generate indicators. Write a very detailed and nuanced report of the trends you observe. Do not simply state the trends are mixed, provide detailed and finegrained analysis and insights that may help traders make decisions."""
-            + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
-        )
+    + """ Make sure to append a Markdown table at the end of the report to organize key points in the report, organized and easy to read."""
+)
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a helpful AI assistant, collaborating with other assistants."
-                    " Use the provided tools to progress towards answering the question."
-                    " If you are unable to fully answer, that's OK; another assistant with different tools"
-                    " will help where you left off. Execute what you can to make progress."
-                    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
-                    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
-                    " You have access to the following tools: {tool_names}.\n{system_message}"
-                    "For your reference, the current date is {current_date}. The company we want to look at is {ticker}",
-                ),
-                MessagesPlaceholder(variable_name="messages"),
-            ]
-        )
 
-        prompt = prompt.partial(system_message=system_message)
-        prompt = prompt.partial(tool_names=", ".join([tool.name for tool in tools]))
-        prompt = prompt.partial(current_date=current_date)
-        prompt = prompt.partial(ticker=ticker)
+def create_market_analyst(llm, toolkit):
+    suffix = "For your reference, the current date is {current_date}. The company we want to look at is {ticker}"
+
+    # Use crypto-specific tools for crypto, the original stock tools otherwise
+    crypto_chain = create_analyst_chain(
+        llm, toolkit, CRYPTO_SYSTEM_MESSAGE, [toolkit.get_crypto_price_history, toolkit.get_crypto_technical_analysis], suffix
+    )
+    stock_online_chain = create_analyst_chain(
+        llm, toolkit, STOCK_SYSTEM_MESSAGE, [toolkit.get_YFin_data_online, toolkit.get_stockstats_indicators_report_online], suffix
+    )
+    stock_offline_chain = create_analyst_chain(
+        llm, toolkit, STOCK_SYSTEM_MESSAGE, [toolkit.get_YFin_data, toolkit.get_stockstats_indicators_report], suffix
+    )
 
-        chain = prompt | llm.bind_tools(tools)
+    def market_analyst_node(state):
+        current_date = state["trade_date"]
+        ticker = state["company_of_interest"]
 
-        result = chain.invoke(state["messages"])
+        # Check if we're dealing with crypto or stocks
+        if is_crypto_symbol(ticker):
+            chain = crypto_chain
+        elif toolkit.config["online_tools"]:
+            chain = stock_online_chain
+        else:
+            chain = stock_offline_chain
+
+        result = chain.invoke(
+            {
+                "messages": state["messages"],
+                "current_date": current_date,
+                "ticker": ticker,
+            }
+        )
 
         report = ""
 
         if len(result.tool_calls) == 0:
             report = result.content
-       
+
         return {
             "messages": [result],
             "market_report": report,
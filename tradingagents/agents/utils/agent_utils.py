@@ -2,7 +2,8 @@ from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage, AIMe
 from typing import List
 from typing import Annotated
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.messages import RemoveMessage
+from langchain_core.messages import RemoveMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_core.tools import tool
 from datetime import date, timedelta, datetime
 import functools
@@ -31,6 +32,57 @@ def create_msg_delete():
     return delete_messages
 
 
+def create_analyst_prompt(static_prefix, dynamic_suffix, cache_prefix=False):
+    """
+    Build the prompt step of an analyst chain: one system message followed by the conversation.
+    static_prefix never changes for a chain; dynamic_suffix is a str.format template filled
+    from the invoke input (e.g. current_date, ticker) and always comes last. With cache_prefix
+    the prefix is sent as an Anthropic ephemeral cache block, so the tool schemas and prefix
+    are billed and processed as cached input on repeat calls.
+    """
+    if cache_prefix:
+        static_block = {
+            "type": "text",
+            "text": static_prefix,
+            "cache_control": {"type": "ephemeral"},
+        }
+
+    def render(inputs):
+        suffix = dynamic_suffix.format(**inputs)
+        if cache_prefix:
+            content = [static_block, {"type": "text", "text": suffix}]
+        else:
+            content = static_prefix + suffix
+        return [SystemMessage(content=content), *inputs["messages"]]
+
+    return RunnableLambda(render)
+
+
+ANALYST_PREAMBLE = (
+    "You are a helpful AI assistant, collaborating with other assistants."
+    " Use the provided tools to progress towards answering the question."
+    " If you are unable to fully answer, that's OK; another assistant with different tools"
+    " will help where you left off. Execute what you can to make progress."
+    " If you or any other assistant has the FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** or deliverable,"
+    " prefix your response with FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL** so the team knows to stop."
+)
+
+
+def create_analyst_chain(llm, toolkit, system_message, tools, suffix):
+    """
+    Build an analyst's prompt | tool-bound LLM chain once, at node creation time.
+    The collaboration preamble, tool names and system_message form the static prefix
+    (cached on Anthropic); suffix is the per-call template, e.g. current_date and ticker.
+    """
+    tool_names = ", ".join([tool.name for tool in tools])
+    prompt = create_analyst_prompt(
+        f"{ANALYST_PREAMBLE} You have access to the following tools: {tool_names}.\n{system_message}",
+        suffix,
+        cache_prefix=toolkit.config["llm_provider"].lower() == "anthropic",
+    )
+    return prompt | llm.bind_tools(tools)
+
+
 class Toolkit:
     _config = DEFAULT_CONFIG.copy()
 
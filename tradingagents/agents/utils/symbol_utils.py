@@ -0,0 +1,41 @@
+import functools
+
+
+# Known crypto symbols (most common ones)
+_CRYPTO: frozenset[str] = frozenset({
+    'BTC', 'ETH', 'ADA', 'SOL', 'DOT', 'AVAX', 'MATIC', 'LINK', 'UNI', 'AAVE',
+    'XRP', 'LTC', 'BCH', 'EOS', 'TRX', 'XLM', 'VET', 'ALGO', 'ATOM', 'LUNA',
+    'NEAR', 'FTM', 'CRO', 'SAND', 'MANA', 'AXS', 'GALA', 'ENJ', 'CHZ', 'BAT',
+    'ZEC', 'DASH', 'XMR', 'DOGE', 'SHIB', 'PEPE', 'FLOKI', 'BNB', 'USDT', 'USDC',
+    'TON', 'ICP', 'HBAR', 'THETA', 'FIL', 'ETC', 'MKR', 'APT', 'LDO', 'OP',
+    'IMX', 'GRT', 'RUNE', 'FLOW', 'EGLD', 'XTZ', 'MINA', 'ROSE', 'KAVA'
+})
+
+# Known stock symbols (to avoid false positives)
+_STOCKS: frozenset[str] = frozenset({
+    'AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX', 'DIS', 'AMD',
+    'INTC', 'CRM', 'ORCL', 'ADBE', 'CSCO', 'PEP', 'KO', 'WMT', 'JNJ', 'PFE',
+    'V', 'MA', 'HD', 'UNH', 'BAC', 'XOM', 'CVX', 'LLY', 'ABBV', 'COST',
+    'AVGO', 'TMO', 'ACN', 'DHR', 'TXN', 'LOW', 'QCOM', 'HON', 'UPS', 'MDT'
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def is_crypto_symbol(symbol: str) -> bool:
+    """
+    Detect if a symbol is likely a cryptocurrency
+    Uses a whitelist approach for known crypto symbols and excludes known stock patterns
+    """
+    s = symbol.upper()
+
+    # If it's a known stock symbol, it's definitely not crypto
+    if s in _STOCKS:
+        return False
+
+    # If it's a known crypto symbol, it's definitely crypto
+    if s in _CRYPTO:
+        return True
+
+    # Unknown symbols are treated as crypto only when they are short (up to 4
+    # chars) and purely alphanumeric; isalnum() also rejects '.', '-' and '_'
+    return len(s) <= 4 and s.isalnum()
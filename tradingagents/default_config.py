@@ -13,10 +13,15 @@ DEFAULT_CONFIG = {
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    # Reuse responses to identical LLM prompts: None, "memory" or "sqlite"
+    # (persisted under dataflows/data_cache)
+    "llm_cache": None,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently instead of one after another
+    "parallel_analysts": False,
     # Tool settings
     "online_tools": True,
 }
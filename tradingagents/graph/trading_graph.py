@@ -6,6 +6,7 @@ import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
+from langchain_core.caches import BaseCache, InMemoryCache
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -59,6 +60,7 @@ class TradingAgentsGraph:
         )
 
         # Initialize LLMs
+        llm_cache = self._create_llm_cache()
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
             # For OpenRouter, we need to add additional headers
             extra_headers = {}
@@ -78,44 +80,52 @@ class TradingAgentsGraph:
                 model=self.config["deep_think_llm"], 
                 base_url=self.config["backend_url"],
                 api_key=self.config["api_key"],
-                default_headers=extra_headers
+                default_headers=extra_headers,
+                cache=llm_cache
             )
             self.quick_thinking_llm = ChatOpenAI(
                 model=self.config["quick_think_llm"], 
                 base_url=self.config["backend_url"],
                 api_key=self.config["api_key"],
-                default_headers=extra_headers
+                default_headers=extra_headers,
+                cache=llm_cache
             )
         elif self.config["llm_provider"].lower() == "anthropic":
             self.deep_thinking_llm = ChatAnthropic(
                 model=self.config["deep_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
+                api_key=self.config["api_key"],
+                cache=llm_cache
             )
             self.quick_thinking_llm = ChatAnthropic(
                 model=self.config["quick_think_llm"], 
                 base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
+                api_key=self.config["api_key"],
+                cache=llm_cache
             )
         elif self.config["llm_provider"].lower() == "google":
             self.deep_thinking_llm = ChatGoogleGenerativeAI(
                 model=self.config["deep_think_llm"],
-                google_api_key=self.config["api_key"]
+                google_api_key=self.config["api_key"],
+                cache=llm_cache
             )
             self.quick_thinking_llm = ChatGoogleGenerativeAI(
                 model=self.config["quick_think_llm"],
-                google_api_key=self.config["api_key"]
+                google_api_key=self.config["api_key"],
+                cache=llm_cache
             )
         elif self.config["llm_provider"].lower() == "deepseek":
             self.deep_thinking_llm = ChatDeepSeek(
                 model=self.config["deep_think_llm"],
                 base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
+                api_key=self.config["api_key"],
+                cache=llm_cache
             )
             self.quick_thinking_llm = ChatDeepSeek(
                 model=self.config["quick_think_llm"],
                 base_url=self.config["backend_url"],
-                api_key=self.config["api_key"]
+                api_key=self.config["api_key"],
+                cache=llm_cache
             )
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
@@ -157,7 +167,28 @@ class TradingAgentsGraph:
         self.log_states_dict = {}  # date to full state dict
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+        )
+
+    def _create_llm_cache(self) -> Optional[BaseCache]:
+        """Create the response cache shared by both LLMs, if one is configured."""
+        cache_type = self.config.get("llm_cache")
+        if not cache_type:
+            return None
+        if cache_type == "memory":
+            return InMemoryCache()
+        if cache_type == "sqlite":
+            # langchain_community is only needed when the persistent cache is used
+            from langchain_community.cache import SQLiteCache
+
+            return SQLiteCache(
+                database_path=os.path.join(
+                    self.config["project_dir"], "dataflows/data_cache/llm_cache.db"
+                )
+            )
+        raise ValueError(f"Unsupported LLM cache: {cache_type}")
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
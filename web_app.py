@@ -1,5 +1,6 @@
 from flask import Flask, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import json
 import threading
@@ -56,6 +57,15 @@ socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 # Global storage for analysis sessions
 analysis_sessions = {}
 
+# Analyses run on a bounded pool; extra requests queue up to a limit and are
+# rejected beyond it instead of spawning an unbounded number of threads.
+# Unlike the old daemon threads, interpreter exit waits for accepted analyses.
+_MAX_WORKERS = int(os.getenv('WEB_MAX_WORKERS', '8'))
+_MAX_QUEUED_ANALYSES = int(os.getenv('WEB_MAX_QUEUED', '32'))
+_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix='analysis')
+# One slot per running or queued analysis, released when the job finishes
+_analysis_slots = threading.BoundedSemaphore(_MAX_WORKERS + _MAX_QUEUED_ANALYSES)
+
 class WebMessageBuffer:
     def __init__(self, session_id):
         self.session_id = session_id
@@ -155,28 +165,31 @@ def health_check():
 
 @app.route('/api/start_analysis', methods=['POST'])
 def start_analysis():
-    data = request.json
-    session_id = data.get('session_id', str(int(time.time())))
-    
-    # Store analysis configuration
-    analysis_sessions[session_id] = {
-        'config': data,
-        'buffer': WebMessageBuffer(session_id),
-        'status': 'running'
-    }
+    if not _analysis_slots.acquire(blocking=False):
+        return jsonify({'error': 'Too many analyses in progress, please retry later'}), 429
     
-    # Start analysis in background
-    thread = threading.Thread(
-        target=run_analysis_background, 
-        args=(session_id, data)
-    )
-    thread.daemon = True
-    thread.start()
+    try:
+        data = request.json
+        session_id = data.get('session_id', str(int(time.time())))
+        
+        # Store analysis configuration
+        analysis_sessions[session_id] = {
+            'config': data,
+            'buffer': WebMessageBuffer(session_id),
+            'status': 'running'
+        }
+        
+        # Start analysis in background
+        future = _EXECUTOR.submit(run_analysis_background, session_id, data)
+    except BaseException:
+        _analysis_slots.release()
+        raise
+    future.add_done_callback(lambda _: _analysis_slots.release())
     
     return jsonify({'session_id': session_id, 'status': 'started'})
 
 def run_analysis_background(session_id: str, config: Dict):
-    """Run the trading analysis in background thread"""
+    """Run the trading analysis on an executor worker thread"""
     import traceback
     try:
         if not is_production():
@@ -257,7 +270,10 @@ def run_analysis_background(session_id: str, config: Dict):
                 last_message = chunk["messages"][-1]
                 
                 if hasattr(last_message, "content"):
-                    content = str(last_message.content)
+                    # Plain-text content is measured in place; only content
+                    # blocks (lists) need converting to a string first
+                    raw = last_message.content
+                    content = raw if isinstance(raw, str) else str(raw)
                     if len(content) > 500:  # Truncate very long messages
                         content = content[:500] + "..."
                     buffer.add_message("Analysis", content)
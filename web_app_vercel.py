@@ -1,41 +1,67 @@
 from flask import Flask, render_template, request, jsonify
 import datetime
-import json
+import logging
+import orjson
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 import os
 
+from json_provider import OrjsonProvider
+
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'tradingagents_secret_key'
+app.json = OrjsonProvider(app)
 
 # Global storage for analysis sessions (simplified for serverless)
 analysis_sessions = {}
 
+# Responses that never change are built once and reused across requests
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_NOT_FOUND_BODY = orjson.dumps({'error': 'Not found', 'message': 'The requested resource was not found'})
+_INTERNAL_ERROR_BODY = orjson.dumps({'error': 'Internal server error', 'message': 'An unexpected error occurred'})
+_rendered_pages = {}
+
+def render_cached(template_name):
+    """Render a static template once and serve the cached HTML afterwards"""
+    page = _rendered_pages.get(template_name)
+    if page is None:
+        page = _rendered_pages[template_name] = render_template(template_name)
+    return page
+
 class SimpleMessageBuffer:
+    __slots__ = ('session_id', 'messages', 'agent_status', 'report_sections',
+                 'current_step', 'progress')
+
+    AGENT_STATUS_TEMPLATE = {
+        "Market Analyst": "pending",
+        "Social Analyst": "pending", 
+        "News Analyst": "pending",
+        "Fundamentals Analyst": "pending",
+        "Bull Researcher": "pending",
+        "Bear Researcher": "pending",
+        "Research Manager": "pending",
+        "Trader": "pending",
+        "Portfolio Manager": "pending",
+    }
+
+    REPORT_SECTIONS_TEMPLATE = {
+        "market_report": None,
+        "sentiment_report": None,
+        "news_report": None,
+        "fundamentals_report": None,
+        "investment_plan": None,
+        "trader_investment_plan": None,
+        "final_trade_decision": None,
+    }
+
     def __init__(self, session_id):
         self.session_id = session_id
         self.messages = []
-        self.agent_status = {
-            "Market Analyst": "pending",
-            "Social Analyst": "pending", 
-            "News Analyst": "pending",
-            "Fundamentals Analyst": "pending",
-            "Bull Researcher": "pending",
-            "Bear Researcher": "pending",
-            "Research Manager": "pending",
-            "Trader": "pending",
-            "Portfolio Manager": "pending",
-        }
-        self.report_sections = {
-            "market_report": None,
-            "sentiment_report": None,
-            "news_report": None,
-            "fundamentals_report": None,
-            "investment_plan": None,
-            "trader_investment_plan": None,
-            "final_trade_decision": None,
-        }
+        self.agent_status = self.AGENT_STATUS_TEMPLATE.copy()
+        self.report_sections = self.REPORT_SECTIONS_TEMPLATE.copy()
         self.current_step = "waiting"
         self.progress = 0
 
@@ -58,7 +84,7 @@ class SimpleMessageBuffer:
 @app.route('/')
 def index():
     try:
-        return render_template('index.html')
+        return render_cached('index.html')
     except Exception as e:
         return jsonify({
             'error': 'Template not found',
@@ -69,7 +95,7 @@ def index():
 @app.route('/analysis')
 def analysis_page():
     try:
-        return render_template('analysis.html')
+        return render_cached('analysis.html')
     except Exception as e:
         return jsonify({
             'error': 'Template not found', 
@@ -116,6 +142,7 @@ def start_analysis():
         })
         
     except Exception as e:
+        logger.exception("Failed to process analysis request")
         return jsonify({
             'error': str(e),
             'message': 'Failed to process analysis request'
@@ -139,40 +166,44 @@ def get_session_status(session_id):
         else:
             return jsonify({'error': 'Session not found'}), 404
     except Exception as e:
+        logger.exception("Failed to read status for session %s", session_id)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/health')
 def health_check():
-    return jsonify({
+    return orjson.dumps({
         'status': 'healthy', 
         'timestamp': datetime.datetime.now().isoformat(),
         'environment': 'vercel',
         'mode': 'demo'
-    })
+    }), 200, _JSON_HEADERS
+
+# /api/info never changes, so serialize it once at import time
+_INFO_BODY = orjson.dumps({
+    'name': 'Trading Agents Crypto - Vercel Demo',
+    'version': '1.0.0-vercel',
+    'description': 'Simplified demo version for Vercel deployment',
+    'limitations': [
+        'No real-time analysis',
+        'No persistent storage', 
+        'Demo responses only',
+        'Limited to 5-minute execution time'
+    ],
+    'recommendation': 'For full functionality, deploy to a persistent server environment'
+})
 
 @app.route('/api/info')
 def api_info():
-    return jsonify({
-        'name': 'Trading Agents Crypto - Vercel Demo',
-        'version': '1.0.0-vercel',
-        'description': 'Simplified demo version for Vercel deployment',
-        'limitations': [
-            'No real-time analysis',
-            'No persistent storage', 
-            'Demo responses only',
-            'Limited to 5-minute execution time'
-        ],
-        'recommendation': 'For full functionality, deploy to a persistent server environment'
-    })
+    return _INFO_BODY, 200, _JSON_HEADERS
 
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Not found', 'message': 'The requested resource was not found'}), 404
+    return _NOT_FOUND_BODY, 404, _JSON_HEADERS
 
 @app.errorhandler(500)  
 def internal_error(error):
-    return jsonify({'error': 'Internal server error', 'message': 'An unexpected error occurred'}), 500
+    return _INTERNAL_ERROR_BODY, 500, _JSON_HEADERS
 
 if __name__ == '__main__':
-    app.run(debug=True) 
\ No newline at end of file
+    app.run(debug=False, threaded=True) 
\ No newline at end of file